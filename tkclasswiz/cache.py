@@ -30,7 +30,7 @@ def cache_result(max: int = 256):
         def wrapper(*args, **kwargs):
             try:
                 # Convert to pickle string to allow hashing of non-hashables (dictionaries, lists, ...)
-                key = pickle.dumps((*args, kwargs))
+                key = pickle.dumps((*args, kwargs), protocol=pickle.HIGHEST_PROTOCOL)
             except Exception:
                 return fnc(*args, **kwargs)
 
@@ -21,10 +21,13 @@ class Messagebox:
     Wrapper for some of Messagebox methods, that offers compatibility between
     ttk and ttkbootstrap.
     """
-    def _process_kwargs(kwargs):
-        if "master" in kwargs:
-            kwargs['parent'] = kwargs["master"]
-            del kwargs["master"]
+    @staticmethod
+    def _process_kwargs(kwargs: dict):
+        if not kwargs:
+            return
+
+        if (master := kwargs.pop("master", None)) is not None:
+            kwargs["parent"] = master
 
     if TTKBOOT_INSTALLED:
         @classmethod
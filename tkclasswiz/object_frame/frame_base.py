@@ -1,6 +1,5 @@
 from typing import get_args, get_origin, Iterable, Union, Literal, Any, TYPE_CHECKING, TypeVar
 from abc import ABC, abstractmethod
-from contextlib import suppress
 from functools import cache
 
 from ..convert import *
@@ -175,13 +174,11 @@ class NewObjectFrameBase(ttk.Frame, ABC):
             return value
 
         for type_ in types:
-            with suppress(Exception):
-                cast_funct = CAST_FUNTIONS.get(type_)
-                if cast_funct is None:
-                    value = type_(value)
-                else:
-                    value = cast_funct(value)
+            try:
+                value = CAST_FUNTIONS.get(type_, type_)(value)
                 break
+            except Exception:
+                pass
         else:
             raise TypeError(f"Could not convert '{value}' to any of accepted types.\nAccepted types: '{types}'")
 
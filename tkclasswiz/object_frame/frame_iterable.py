@@ -160,7 +160,7 @@ class NewObjectFrameIterable(NewObjectFrameBase):
     def _edit_selected(self):
         selection = self.storage_widget.curselection()
         if len(selection) == 1:
-            object_ = self.storage_widget.get()[selection[0]]
+            object_ = self.storage_widget.get(selection[0], selection[0] + 1)[0]
             if isinstance(object_, ObjectInfo):
                 self.new_object_frame(object_.class_, self.storage_widget, old_data=object_)
             else:
@@ -226,8 +226,7 @@ class NewObjectFrameStruct(NewObjectFrameBase):
                 combo["values"] = values
                 # tkvalid.add_option_validation(combo, values)
             elif entry_type is bool:
-                combo.insert(tk.END, True)
-                combo.insert(tk.END, False)
+                combo.insert_many(tk.END, (True, False))
                 # tkvalid.add_option_validation(combo, ["True", "False", ''])
             elif issubclass_noexcept(entry_type, Enum) and not issubclass_noexcept(entry_type, Flag):
                 combo["values"] = values = [en for en in entry_type]
@@ -244,8 +243,7 @@ class NewObjectFrameStruct(NewObjectFrameBase):
                     )
 
         # Additional values to be inserted into ComboBox
-        for value in additional_values.get(k, []):
-            combo.insert(tk.END, value)
+        combo.insert_many(tk.END, additional_values.get(k, []))
 
         # The class of last list like type. Needed when "Edit selected" is used
         # since we don't know what type it was
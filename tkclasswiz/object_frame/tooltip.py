@@ -5,15 +5,16 @@ from abc import ABCMeta, abstractmethod
 from typing import Optional
 
 from ..convert import ObjectInfo
-from ..storage import *
+from ..storage import ListBoxScrolled
 
 
-class BaseToolTip(tk.Toplevel):
+class BaseToolTip:
     """
     .. versionadded:: 1.2
 
     Used to display a nickname tooltip based on ``ObjectInfo.nickname`` attribute.
     It's triggered on ``enter_event`` after ``timeout_ms`` milliseconds and disappears on ``leave_event``.
+    The tooltip window is only created the first time the tooltip is scheduled.
     """
     __metaclass__ = ABCMeta
 
@@ -22,51 +23,71 @@ class BaseToolTip(tk.Toplevel):
         widget: tk.Widget,
         timeout_ms: int = 500,
     ):
-        super().__init__(widget)
+        self.toplevel: Optional[tk.Toplevel] = None
+        self.label: Optional[ttk.Label] = None
+        self.schedule_id = None
+        self._motion_pending = False
+        self._widget = widget
+        self.timeout_ms = timeout_ms
+
+    def _ensure_built(self):
+        if self.toplevel is not None:
+            return
+
+        toplevel = tk.Toplevel(self._widget)
         ttk.Style().configure(
             style="tooltip.TLabel",  # ttkbootstrap compatibility
             background="white",
         )
-        self.label = ttk.Label(self, style="tooltip.TLabel", wraplength=1000)
-        self.schedule_id = None
-        self._widget = widget
-        self.timeout_ms = timeout_ms
+        self.label = ttk.Label(toplevel, style="tooltip.TLabel", wraplength=1000)
         self.label.pack()
-        self.pack_propagate(True)
-        self._hide_tooltip()
-        self.overrideredirect(True)
-        self.attributes('-topmost', True)
+        toplevel.pack_propagate(True)
+        toplevel.withdraw()
+        toplevel.overrideredirect(True)
+        toplevel.attributes('-topmost', True)
+        self.toplevel = toplevel
 
     def _schedule(self, event: tk.Event):
         if not (value := self._get_value()):
             return
 
-        self.label.config(text=str(value)[:3000])
+        self._ensure_built()
+        self.label.config(text=value[:3000])
         if self.timeout_ms:
-            self.schedule_id = self.after(self.timeout_ms, lambda: self._show_tooltip(event))
+            self.schedule_id = self._widget.after(self.timeout_ms, lambda: self._show_tooltip(event))
         else:
-            self.after_idle(lambda: self._show_tooltip(event))
+            self._widget.after_idle(lambda: self._show_tooltip(event))
 
     def _cancel_schedule(self, event: tk.Event):
         if self.schedule_id:
-            self.after_cancel(self.schedule_id)
+            self._widget.after_cancel(self.schedule_id)
             self.schedule_id = None
 
         self._hide_tooltip()
 
     def _show_tooltip(self, event: tk.Event):
-        self.geometry("")
-        self.deiconify()
+        self.toplevel.geometry("")
+        self.toplevel.deiconify()
+        self._update_pos(event)
+        self._widget.bind("<Motion>", self._schedule_update_pos)
+
+    def _schedule_update_pos(self, event: tk.Event):
+        # Coalesce motion events, so that the tooltip is moved at most once per idle cycle.
+        if not self._motion_pending:
+            self._motion_pending = True
+            self._widget.after_idle(self._update_pos_pending, event)
+
+    def _update_pos_pending(self, event: tk.Event):
+        self._motion_pending = False
         self._update_pos(event)
-        self._widget.bind("<Motion>", self._update_pos)
 
     def _update_pos(self, event: tk.Event):
-        geo = self.geometry().split('+')[0]
-        x, y = self.winfo_pointerxy()
-        self.geometry(f'{geo}+{x + 10}+{y + 10}')
+        x, y = self._widget.winfo_pointerxy()
+        self.toplevel.geometry(f'+{x + 10}+{y + 10}')  # Position only, the size is kept
 
     def _hide_tooltip(self):
-        self.withdraw()
+        if self.toplevel is not None:
+            self.toplevel.withdraw()
         
 
     @abstractmethod
@@ -86,21 +107,20 @@ class ListboxTooltip(BaseToolTip):
         self.start_y = 0
 
     def _get_value(self):
-        value = self._widget.get()
         selection = self._widget.curselection()
         if len(selection) != 1:
             return
 
-        value = value[self._widget.current()]
-        return str(value)
+        index = selection[0]
+        return str(self._widget.get(index, index + 1)[0])
 
     def _show_tooltip(self, event: tk.Event):
-        self.start_y = self.winfo_pointery()
+        self.start_y = self._widget.winfo_pointery()
         super()._show_tooltip(event)
 
     def _update_pos(self, event: tk.Event):
         super()._update_pos(event)
-        if abs(self.start_y - self.winfo_pointery()) > 10:
+        if abs(self.start_y - self._widget.winfo_pointery()) > 10:
             self._cancel_schedule(event)
 
 
@@ -41,12 +41,13 @@ class HintedEntry(ttk.Entry):
     def __init__(self, hint: str, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.hint = hint
+        self._showing_hint = False  # Avoids reading the foreground color back from Tk
         self._set_hint()
         self.bind("<FocusIn>", self._focus_in)
         self.bind("<FocusOut>", self._focus_out)
 
     def get(self) -> str:
-        if str(self["foreground"]) == "gray":
+        if self._showing_hint:
             return ''
 
         return super().get()
@@ -54,21 +55,24 @@ class HintedEntry(ttk.Entry):
     def insert(self, *args, **kwargs) -> None:
         state = self.cget("state")
         self.config(state="enabled")
-        if str(self["foreground"]) == "gray":
+        if self._showing_hint:
             self.delete('0', tk.END)
 
         _ret = super().insert(*args, **kwargs)
         self["foreground"] = "black"
+        self._showing_hint = False
         self.config(state=state)
         return _ret
 
     def _set_hint(self):
         self.insert('0', self.hint)
         self["foreground"] = "gray"
+        self._showing_hint = True
 
     def _focus_in(self, event: tk.Event):
-        if str(self["foreground"]) == "gray":
+        if self._showing_hint:
             self["foreground"] = 'black'
+            self._showing_hint = False
             self.delete('0', tk.END)
 
     def _focus_out(self, event: tk.Event):
@@ -84,7 +88,9 @@ class PyObjectScalar(ttk.Frame):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.element = None
-        self.display = ttk.Entry(self, state="readonly")
+        self._element_text = ""
+        self.text = tk.StringVar(self)
+        self.display = ttk.Entry(self, state="readonly", textvariable=self.text)
         self.display.pack(fill=tk.BOTH, expand=True)
 
     def get(self) -> object:
@@ -97,10 +103,11 @@ class PyObjectScalar(ttk.Frame):
         """
         Sets the Python object as the widget's value.
         """
-        self.display.config(state="active")
-        self.display.delete("0", tk.END)
-        self.display.insert(tk.END, str(value))
-        self.display.config(state="readonly")
+        text = str(value)
+        if text != self._element_text:  # Skip the Tcl call when the displayed text would not change
+            self.text.set(text)  # Readonly entries still follow their text variable
+            self._element_text = text
+
         self.element = value
 
 
@@ -156,8 +163,7 @@ class ListBoxObjects(tk.Listbox):
         if isinstance(index, str):
             index = len(self._original_items) if index == "end" else 0
 
-        old_data = self._original_items[index:]
-        self._original_items[index:] = list(elements) + old_data
+        self._original_items[index:index] = elements
 
         return _ret
 
@@ -165,30 +171,27 @@ class ListBoxObjects(tk.Listbox):
         """
         Delete elements that have the index in ``indexes``
         """
-        def create_ranges() -> List[tuple]:
-            start_i = indexes[0]
-            len_indexes = len(indexes)
-            for i in range(1, len_indexes):
-                if indexes[i] > indexes[i - 1] + 1:  # Current index more than 1 bigger than previous
-                    to_yield = start_i, indexes[i - 1]
-                    yield to_yield
+        if indexes[-1] == "end":
+            indexes = range(indexes[0], len(self._original_items))
 
-                    # After element is erased, all items' indexes get shifted to the left
-                    # from the deleted item forward (right) -> Need to shift our list of indexes also.
-                    for j in range(i, len_indexes):
-                        indexes[j] -= (to_yield[1] - to_yield[0] + 1)
+        # curselection() already returns ascending indexes, sort only when needed.
+        if any(a > b for a, b in zip(indexes, indexes[1:])):
+            indexes = sorted(indexes)
 
-                    start_i = indexes[i]
+        # Delete ranges of consecutive indexes from the back,
+        # so that the indexes in front of each deleted range stay valid.
+        indexes = reversed(indexes)
+        end = start = next(indexes)
+        for index in indexes:
+            if index < start - 1:  # Gap between ranges
+                super().delete(start, end)
+                del self._original_items[start:end + 1]
+                end = index
 
-            yield start_i, indexes[-1]
+            start = index
 
-        if indexes[-1] == "end":
-            indexes = range(indexes[0], len(self._original_items))
-
-        indexes = sorted(list(indexes))
-        for range_ in create_ranges():
-            super().delete(*range_)
-            del self._original_items[range_[0]:range_[1] + 1]
+        super().delete(start, end)
+        del self._original_items[start:end + 1]
 
     def count(self) -> int:
         """
@@ -220,7 +223,7 @@ class ListBoxObjects(tk.Listbox):
         """
         selection = self.curselection()
         if len(selection):
-            object_: Union[ObjectInfo, Any] = self.get()[min(selection):max(selection) + 1]
+            object_: Union[ObjectInfo, Any] = self._original_items[min(selection):max(selection) + 1]
             GLOBAL.clipboard = object_ if len(selection) > 1 else object_[0]
         else:
             Messagebox.show_error("Empty list!", "Select atleast one item!", parent=self)
@@ -287,6 +290,20 @@ class ListBoxScrolled(ttk.Frame):
 
         listbox.config(yscrollcommand=scrollbar.set)
 
+        # Bind the frequently used methods directly, to avoid going through __getattr__
+        self.current = listbox.current
+        self.get = listbox.get
+        self.insert = listbox.insert
+        self.delete = listbox.delete
+        self.count = listbox.count
+        self.clear = listbox.clear
+        self.curselection = listbox.curselection
+        self.delete_selected = listbox.delete_selected
+        self.save_to_clipboard = listbox.save_to_clipboard
+        self.paste_from_clipboard = listbox.paste_from_clipboard
+        self.move = listbox.move
+        self.move_selection = listbox.move_selection
+
     def __getattr__(self, name: str):
         """
         Getter method that only get's called if the current
@@ -306,6 +323,7 @@ class ComboBoxObjects(ttk.Combobox):
     """
     def __init__(self, *args, **kwargs):
         self._original_items = []
+        self._display_items = []  # Text representation of _original_items
         super().__init__(*args, **kwargs)
 
     def save_to_clipboard(self):
@@ -319,11 +337,14 @@ class ComboBoxObjects(ttk.Combobox):
         value = GLOBAL.clipboard
         if value is _NoClipBoard:
             return
-        
-        if value not in self._original_items:
+
+        try:
+            index = self._original_items.index(value)
+        except ValueError:
             self.insert(tk.END, value)
-        
-        self.current(self._original_items.index(value))
+            index = len(self._original_items) - 1
+
+        self.current(index)
 
     def get(self) -> Any:
         "Returns selected element"
@@ -337,29 +358,55 @@ class ComboBoxObjects(ttk.Combobox):
         """
         Removes the element at ``index``.
         """
-        self["values"].pop(index)
+        self._original_items.pop(index)
+        self._display_items.pop(index)
         super().delete(index)
-        self["values"] = self["values"]  # Update the text list, NOT a code mistake
+        self._update_internal()
 
     def insert(self, index: Union[int, str], element: Any) -> None:
         """
         Insert the ``element`` to the spot at ``index``.
         """
+        display = str(element)[:200]
         if index == tk.END:
             self._original_items.append(element)
+            self._display_items.append(display)
         else:
             self._original_items.insert(index, element)
+            self._display_items.insert(index, display)
 
-        self["values"] = self._original_items
+        self._update_internal()
+
+    def insert_many(self, index: Union[int, str], elements: Iterable[Any]) -> None:
+        """
+        .. versionadded:: 1.4.11
+
+        Insert all of the ``elements`` to the spot at ``index``.
+        The displayed values are updated only once, after all the elements are inserted.
+        """
+        elements = list(elements)
+        if not elements:
+            return
+
+        if index == tk.END:
+            index = len(self._original_items)
+
+        self._original_items[index:index] = elements
+        self._display_items[index:index] = [str(x)[:200] for x in elements]
+        self._update_internal()
 
     def count(self) -> int:
         "Returns number of elements inside the ComboBox"
         return len(self._original_items)
 
+    def _update_internal(self):
+        "Updates the displayed text list to match the internal list."
+        super().__setitem__("values", self._display_items)
+
     def __setitem__(self, key: str, value) -> None:
         if key == "values":
             self._original_items = list(value)
-            value = [str(x)[:200] for x in value]
+            self._display_items = value = [str(x)[:200] for x in self._original_items]
 
         return super().__setitem__(key, value)
 